@@ -1,15 +1,23 @@
-from typing import List, Set, Tuple, Union
+from functools import partial
+from typing import Callable, List, Optional, Set, Tuple, Union, cast
 
 from mlp.base import BaseValue
-from mlp.op import AbsOp, AddOp, MulOp, Op, PowOp, ReLUOp
+from mlp.op import AbsOp, AddOp, CheckpointOp, MulOp, Op, PowOp, ReLUOp, SelectOp
+
+
+Segment = Callable[[List["Value"]], List["Value"]]
 
 
 class Value(BaseValue):
     def __init__(
-        self, data: Union[int, float] = 0, op: str = "", children: Tuple[Union["Value", Union[int, float]], ...] = ()
+        self,
+        data: Union[int, float] = 0,
+        op: str = "",
+        children: Tuple[Union["Value", Union[int, float]], ...] = (),
+        segment: Optional[Segment] = None,
     ) -> None:
         super().__init__(data)
-        self._op = self._initialize_op(op, children)
+        self._op = self._initialize_op(op, children, segment)
         self._children: Set[Value] = set(x for x in children if isinstance(x, Value))
 
     def __add__(self, other: Union["Value", Union[int, float]]) -> "Value":
@@ -52,6 +60,12 @@ class Value(BaseValue):
     def relu(self) -> "Value":
         return Value(op="ReLU", children=(self,))
 
+    @staticmethod
+    def checkpoint(segment: Segment, values: List["Value"]) -> List["Value"]:
+        checkpoint_value = Value(op="checkpoint", children=tuple(values), segment=segment)
+        size = len(cast(CheckpointOp, checkpoint_value._op).out_data)
+        return [Value(op="select", children=(checkpoint_value, i)) for i in range(size)]
+
     def backward(self) -> None:
         topology: List[Value] = []
         visited_values: Set[Value] = set()
@@ -67,7 +81,9 @@ class Value(BaseValue):
                 child._find_topology(topology, visited_values)
             topology.append(self)
 
-    def _initialize_op(self, op: str, children: Tuple[Union["Value", Union[int, float]], ...]) -> Op:
+    def _initialize_op(
+        self, op: str, children: Tuple[Union["Value", Union[int, float]], ...], segment: Optional[Segment]
+    ) -> Op:
         if op == "+":
             value, other_value = children
             return AddOp(value=value, other_value=other_value, out_value=self)
@@ -83,4 +99,26 @@ class Value(BaseValue):
         if op == "ReLU":
             (value,) = children
             return ReLUOp(value=value, out_value=self)
+        if op == "checkpoint":
+            assert segment is not None
+            return CheckpointOp(
+                values=[x for x in children if isinstance(x, Value)],
+                forward_fn=partial(self._checkpoint_forward, segment),
+                backward_fn=partial(self._checkpoint_backward, segment),
+                out_value=self,
+            )
+        if op == "select":
+            value, index = children
+            assert isinstance(value, Value) and isinstance(index, int)
+            return SelectOp(checkpoint_op=cast(CheckpointOp, value._op), index=index, out_value=self)
         return Op(out_value=self)
+
+    @staticmethod
+    def _checkpoint_forward(segment: Segment, data: List[float]) -> List[float]:
+        return [out.data for out in segment(list(map(Value, data)))]
+
+    @staticmethod
+    def _checkpoint_backward(segment: Segment, data: List[float], grads: List[float]) -> List[float]:
+        inputs = list(map(Value, data))
+        sum((out * grad for out, grad in zip(segment(inputs), grads)), Value()).backward()
+        return [value.grad for value in inputs]
@@ -0,0 +1,30 @@
+import json
+from operator import mul
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+
+class Evaluator:
+    def __init__(self, input_size: int, layers: List[Dict[str, Any]]) -> None:
+        self._input_size = input_size
+        self._layers: List[Tuple[List[List[float]], List[float], bool]] = [
+            (layer["weights"], layer["biases"], layer["linear"]) for layer in layers
+        ]
+
+    def __call__(self, X: Iterable[Iterable[Union[int, float]]]) -> List[Union[float, List[float]]]:
+        return list(map(self.predict_one, X))
+
+    @classmethod
+    def from_file(cls, path: str) -> "Evaluator":
+        with open(path, "r") as file:
+            weights = json.load(file)
+        return cls(weights["input_size"], weights["layers"])
+
+    def predict_one(self, x: Iterable[Union[int, float]]) -> Union[float, List[float]]:
+        out = list(x)
+        if len(out) != self._input_size:
+            raise ValueError("expected {} inputs, got {}".format(self._input_size, len(out)))
+        for weights, biases, linear in self._layers:
+            out = [sum(map(mul, w, out), b) for w, b in zip(weights, biases)]
+            if not linear:
+                out = [max(z, 0.0) for z in out]
+        return out[0] if len(out) == 1 else out
@@ -0,0 +1,81 @@
+import json
+import math
+from typing import Any, Callable, Dict, List
+
+from mlp.nn import MLP
+
+
+class Exporter:
+    def __init__(self, mlp: MLP, max_unrolled_parameters: int = 1000) -> None:
+        self._mlp = mlp
+        self._max_unrolled_parameters = max_unrolled_parameters
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "input_size": self._mlp.input_size,
+            "layers": [
+                {
+                    "weights": [[w.data for w in neuron.w] for neuron in layer.neurons],
+                    "biases": [neuron.b.data for neuron in layer.neurons],
+                    "linear": layer.linear,
+                }
+                for layer in self._mlp.layers
+            ],
+        }
+
+    def to_file(self, path: str) -> None:
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file)
+
+    def to_source(self, name: str = "predict") -> str:
+        inputs = ["x{}".format(i + 1) for i in range(self._mlp.input_size)]
+        if len(self._mlp.parameters) > self._max_unrolled_parameters:
+            return self._to_loop_source(name, inputs)
+        lines = ["def {}({}):".format(name, ", ".join(inputs))]
+        for i, layer in enumerate(self._mlp.layers):
+            outputs = ["h{}_{}".format(i + 1, j + 1) for j in range(layer.output_size)]
+            for output, neuron in zip(outputs, layer.neurons):
+                terms = ["{} * {}".format(self._to_literal(w.data), x) for w, x in zip(neuron.w, inputs)]
+                z = " + ".join([self._to_literal(neuron.b.data)] + terms)
+                lines.append("    {} = {}".format(output, z if layer.linear else "max({}, 0.0)".format(z)))
+            inputs = outputs
+        lines.append("    return {}".format(inputs[0] if len(inputs) == 1 else "[{}]".format(", ".join(inputs))))
+        return "\n".join(lines) + "\n"
+
+    def to_function(self, name: str = "predict") -> Callable[..., Any]:
+        namespace: Dict[str, Any] = {}
+        exec(self.to_source(name), namespace)
+        return namespace[name]
+
+    def _to_loop_source(self, name: str, inputs: List[str]) -> str:
+        layers = ",\n".join(
+            "    ([{}], [{}], {})".format(
+                ", ".join(
+                    "[{}]".format(", ".join(self._to_literal(w.data) for w in neuron.w)) for neuron in layer.neurons
+                ),
+                ", ".join(self._to_literal(neuron.b.data) for neuron in layer.neurons),
+                layer.linear,
+            )
+            for layer in self._mlp.layers
+        )
+        return "\n".join(
+            [
+                "from operator import mul",
+                "",
+                "_{}_layers = [\n{},\n]".format(name, layers),
+                "",
+                "",
+                "def {}({}):".format(name, ", ".join(inputs)),
+                "    out = [{}]".format(", ".join(inputs)),
+                "    for weights, biases, linear in _{}_layers:".format(name),
+                "        out = [sum(map(mul, w, out), b) for w, b in zip(weights, biases)]",
+                "        if not linear:",
+                "            out = [max(z, 0.0) for z in out]",
+                "    return out[0] if len(out) == 1 else out",
+                "",
+            ]
+        )
+
+    @staticmethod
+    def _to_literal(value: float) -> str:
+        return repr(value) if math.isfinite(value) else "float('{!r}')".format(value)
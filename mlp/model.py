@@ -1,3 +1,4 @@
+import time
 from typing import Iterable, List, Optional, Tuple, Union
 
 from mlp.dataset import Dataset
@@ -5,6 +6,7 @@ from mlp.engine import Value
 from mlp.losses import absolute_error, squared_error
 from mlp.nn import MLP
 from mlp.optimizer import SGD
+from mlp.scheduler import BatchSizeScheduler
 
 
 class Model:
@@ -15,8 +17,10 @@ class Model:
         loss: str,
         patience: int,
         min_delta: float,
-        display_freq: int,
+        display_freq: float,
         verbose: int,
+        checkpoint_every: int = 0,
+        batch_size_scheduler: Optional[BatchSizeScheduler] = None,
     ) -> None:
         self._layer_sizes = layer_sizes
         self._optimizer = optimizer
@@ -24,6 +28,8 @@ class Model:
         self._min_delta = min_delta
         self._display_freq = display_freq
         self._verbose = verbose
+        self._checkpoint_every = checkpoint_every
+        self._batch_size_scheduler = batch_size_scheduler
         self._mlp: Optional[MLP] = None
         if loss == "mse":
             self._loss_fn = squared_error
@@ -33,19 +39,31 @@ class Model:
     def __call__(self, X: Iterable[Iterable[Union[int, float]]]) -> List[Value]:
         return self._predict(X)
 
+    @property
+    def mlp(self) -> MLP:
+        assert self._mlp is not None
+        return self._mlp
+
     def fit(self, train_dataset: Dataset, test_dataset: Dataset, epochs: int, batch_size: int) -> "Model":
         if self._mlp is None:
-            self._mlp = MLP(len(train_dataset[0][0]), self._layer_sizes + [1])
-        num_steps = int(len(train_dataset) / batch_size)
-        display_after = int(self._display_freq * num_steps)
-        self._optimizer.compile(num_steps, self._mlp.parameters)
+            self._mlp = MLP(len(train_dataset[0][0]), self._layer_sizes + [1], self._checkpoint_every)
+        batch_sizes = [self._get_batch_size(len(train_dataset), epoch, batch_size) for epoch in range(epochs)]
+        epoch_steps = [int(len(train_dataset) / epoch_batch_size) for epoch_batch_size in batch_sizes]
+        self._optimizer.compile(epoch_steps, self._mlp.parameters)
         best_epoch, best_train_loss, best_test_loss, waiting = 0, float("inf"), float("inf"), 0
         for epoch in range(epochs):
+            epoch_batch_size, num_steps = batch_sizes[epoch], epoch_steps[epoch]
+            display_after = max(int(self._display_freq * num_steps), 1)
+            if self._batch_size_scheduler is not None:
+                learning_rate_scale = self._batch_size_scheduler.learning_rate_scale(batch_sizes[0], epoch_batch_size)
+                self._optimizer.set_learning_rate_scale(learning_rate_scale)
             self._print_before_epoch(epoch, epochs)
             train_loss = 0.0
+            start_time = time.perf_counter()
             for step in range(num_steps):
-                train_loss += self._step(train_dataset, step, batch_size)
+                train_loss += self._step(train_dataset, step, epoch_batch_size)
                 self._print_after_step(step, train_loss, display_after)
+            throughput = num_steps * epoch_batch_size / (time.perf_counter() - start_time)
             train_loss /= num_steps
             test_loss = self.score(test_dataset)
             best_epoch, best_train_loss, best_test_loss, waiting = self._early_stopping(
@@ -53,7 +71,7 @@ class Model:
             )
             train_dataset.on_epoch_end()
             self._optimizer.on_epoch_end()
-            self._print_after_epoch(train_loss, test_loss)
+            self._print_after_epoch(train_loss, test_loss, epoch_batch_size, throughput)
             if waiting == self._patience:
                 self._print_if_early_stopping(best_epoch)
                 break
@@ -98,6 +116,11 @@ class Model:
         self._optimizer.update_parameters()
         return batch_loss.data
 
+    def _get_batch_size(self, dataset_size: int, epoch: int, batch_size: int) -> int:
+        if self._batch_size_scheduler is not None:
+            batch_size = self._batch_size_scheduler.batch_size(batch_size, epoch)
+        return min(batch_size, dataset_size)
+
     def _early_stopping(
         self,
         best_epoch: int,
@@ -116,10 +139,12 @@ class Model:
         if self._verbose > 1:
             print("Epoch {} / {}".format(epoch + 1, epochs))
 
-    def _print_after_epoch(self, train_loss: float, test_loss: float) -> None:
+    def _print_after_epoch(self, train_loss: float, test_loss: float, batch_size: int, throughput: float) -> None:
         if self._verbose > 1:
-            verbose_format = "{}\tTRAIN_LOSS: {:.6f}\n\tTEST_LOSS: {:.6f}\n"
-            print(verbose_format.format("\n" * (self._verbose > 2), train_loss, test_loss))
+            verbose_format = (
+                "{}\tTRAIN_LOSS: {:.6f}\n\tTEST_LOSS: {:.6f}\n\tBATCH_SIZE: {}\n\tTHROUGHPUT: {:.1f} samples/s\n"
+            )
+            print(verbose_format.format("\n" * (self._verbose > 2), train_loss, test_loss, batch_size, throughput))
 
     def _print_after_step(self, step: int, loss: float, display_after: int) -> None:
         if step % display_after == 0 and self._verbose > 2:
@@ -2,7 +2,7 @@ import random
 from abc import ABC, abstractmethod
 from typing import Iterable, List, Union
 
-from mlp.engine import Value
+from mlp.engine import Segment, Value
 
 
 class Module(ABC):
@@ -49,15 +49,18 @@ class Layer(Module):
 
 
 class MLP(Module):
-    def __init__(self, input_size: int, layer_sizes: List[int]) -> None:
+    def __init__(self, input_size: int, layer_sizes: List[int], checkpoint_every: int = 0) -> None:
         self.input_size = input_size
         self.layer_sizes = layer_sizes
+        self.checkpoint_every = checkpoint_every
         self.sizes = [input_size] + layer_sizes
         self.layers = [
             Layer(self.sizes[i], self.sizes[i + 1], i == len(layer_sizes) - 1) for i in range(len(self.layer_sizes))
         ]
 
     def __call__(self, x: Iterable[Value]) -> Union[Value, List[Value]]:
+        if self.checkpoint_every > 0:
+            return self._call_with_checkpoints(x)
         for layer in self.layers:
             x = layer(x)
         return x
@@ -65,3 +68,19 @@ class MLP(Module):
     @property
     def parameters(self) -> List[Value]:
         return [parameter for layer in self.layers for parameter in layer.parameters]
+
+    def _call_with_checkpoints(self, x: Iterable[Value]) -> Union[Value, List[Value]]:
+        out = list(x)
+        for start in range(0, len(self.layers), self.checkpoint_every):
+            out = Value.checkpoint(self._segment(self.layers[start : start + self.checkpoint_every]), out)
+        return out[0] if len(out) == 1 else out
+
+    @staticmethod
+    def _segment(layers: List[Layer]) -> Segment:
+        def fn(x: List[Value]) -> List[Value]:
+            for layer in layers:
+                out = layer(x)
+                x = [out] if isinstance(out, Value) else out
+            return x
+
+        return fn
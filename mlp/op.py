@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Callable, List, Sequence, Union
 
 from mlp.base import BaseValue
 
@@ -78,3 +78,41 @@ class ReLUOp(Op):
 
     def backward(self) -> None:
         self._value.update_grad((self._value.data > 0.0) * self._out_value.grad)
+
+
+class CheckpointOp(Op):
+    def __init__(
+        self,
+        values: Sequence[BaseValue],
+        forward_fn: Callable[[List[float]], List[float]],
+        backward_fn: Callable[[List[float], List[float]], List[float]],
+        out_value: BaseValue,
+    ) -> None:
+        self._values = values
+        self._forward_fn = forward_fn
+        self._backward_fn = backward_fn
+        self.out_data: List[float] = []
+        self.out_grads: List[float] = []
+        super().__init__(out_value)
+
+    def forward(self) -> None:
+        self.out_data = self._forward_fn([value.data for value in self._values])
+        self.out_grads = [0.0] * len(self.out_data)
+
+    def backward(self) -> None:
+        grads = self._backward_fn([value.data for value in self._values], self.out_grads)
+        for value, grad in zip(self._values, grads):
+            value.update_grad(grad)
+
+
+class SelectOp(Op):
+    def __init__(self, checkpoint_op: CheckpointOp, index: int, out_value: BaseValue) -> None:
+        self._checkpoint_op = checkpoint_op
+        self._index = index
+        super().__init__(out_value)
+
+    def forward(self) -> None:
+        self._out_value.set_data(self._checkpoint_op.out_data[self._index])
+
+    def backward(self) -> None:
+        self._checkpoint_op.out_grads[self._index] += self._out_value.grad
@@ -1,21 +1,41 @@
-from typing import List
+from typing import List, Optional
 
 from mlp.engine import Value
+from mlp.scheduler import LinearPolicy, Policy
 
 
 class SGD:
-    def __init__(self, start_learning_rate: float, end_learning_rate: float, momentum: float) -> None:
+    def __init__(
+        self,
+        start_learning_rate: float,
+        end_learning_rate: float,
+        momentum: float,
+        policy: Optional[Policy] = None,
+        schedule_over_training: bool = False,
+    ) -> None:
         self._start_learning_rate = start_learning_rate
         self._end_learning_rate = end_learning_rate
         self._momentum = momentum
+        self._policy = policy if policy is not None else LinearPolicy()
+        self._schedule_over_training = schedule_over_training
         self._current_lr = start_learning_rate
-        self._iterations = 0
+        self._learning_rate_scale = 1.0
+        self._epoch_iterations: List[int] = []
+        self._epoch = 0
+        self._step = 0
         self._velocities: List[float] = []
         self._parameters: List[Value] = []
 
-    def compile(self, iterations: int, parameters: List[Value]) -> None:
-        self._iterations = iterations
+    def compile(self, epoch_iterations: List[int], parameters: List[Value]) -> None:
+        self._epoch_iterations = epoch_iterations
         self._parameters = parameters
+        self._epoch = 0
+        self._step = 0
+        self._update_learning_rate()
+
+    def set_learning_rate_scale(self, learning_rate_scale: float) -> None:
+        self._learning_rate_scale = learning_rate_scale
+        self._update_learning_rate()
 
     def update_parameters(self) -> None:
         if not self._velocities:
@@ -28,7 +48,22 @@ class SGD:
                 self._velocities[i] = self._momentum * self._velocities[i] + (1 - self._momentum) * parameter.grad
                 parameter.update_data(-self._current_lr * self._velocities[i])
                 parameter.set_grad(0)
-        self._current_lr -= (self._start_learning_rate - self._end_learning_rate) / self._iterations
+        self._step += 1
+        self._update_learning_rate()
 
     def on_epoch_end(self) -> None:
-        self._current_lr = self._start_learning_rate
+        self._epoch = max(min(self._epoch + 1, len(self._epoch_iterations) - 1), 0)
+        if not self._schedule_over_training:
+            self._step = 0
+        self._update_learning_rate()
+
+    def _update_learning_rate(self) -> None:
+        if self._schedule_over_training:
+            iterations = sum(self._epoch_iterations)
+        else:
+            iterations = self._epoch_iterations[self._epoch] if self._epoch_iterations else 0
+        if iterations == 0:
+            self._current_lr = self._learning_rate_scale * self._start_learning_rate
+            return
+        learning_rate = self._policy(self._start_learning_rate, self._end_learning_rate, self._step, iterations)
+        self._current_lr = self._learning_rate_scale * learning_rate
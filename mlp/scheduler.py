@@ -0,0 +1,73 @@
+import math
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class Policy(ABC):
+    @abstractmethod
+    def __call__(self, start_learning_rate: float, end_learning_rate: float, step: int, steps: int) -> float:
+        pass
+
+
+class LinearPolicy(Policy):
+    def __call__(self, start_learning_rate: float, end_learning_rate: float, step: int, steps: int) -> float:
+        return start_learning_rate - (start_learning_rate - end_learning_rate) * step / steps
+
+
+class CosinePolicy(Policy):
+    def __call__(self, start_learning_rate: float, end_learning_rate: float, step: int, steps: int) -> float:
+        cosine = (1 + math.cos(math.pi * step / steps)) / 2
+        return end_learning_rate + (start_learning_rate - end_learning_rate) * cosine
+
+
+class StepPolicy(Policy):
+    def __init__(self, drops: int) -> None:
+        if drops < 1:
+            raise ValueError("drops must be at least 1, got {}".format(drops))
+        self.drops = drops
+
+    def __call__(self, start_learning_rate: float, end_learning_rate: float, step: int, steps: int) -> float:
+        drop = int(self.drops * step / steps) / self.drops
+        return start_learning_rate * (end_learning_rate / start_learning_rate) ** drop
+
+
+class WarmupPolicy(Policy):
+    def __init__(self, policy: Policy, warmup: float) -> None:
+        if not 0 <= warmup <= 1:
+            raise ValueError("warmup must be between 0 and 1, got {}".format(warmup))
+        self.policy = policy
+        self.warmup = warmup
+
+    def __call__(self, start_learning_rate: float, end_learning_rate: float, step: int, steps: int) -> float:
+        learning_rate = self.policy(start_learning_rate, end_learning_rate, step, steps)
+        warmup_steps = math.ceil(self.warmup * steps)
+        return learning_rate * (step + 1) / (warmup_steps + 1) if step < warmup_steps else learning_rate
+
+
+class BatchSizeScheduler:
+    def __init__(
+        self, growth_factor: float, growth_every: int, max_batch_size: Optional[int], learning_rate_scaling: str
+    ) -> None:
+        if growth_factor <= 0:
+            raise ValueError("growth_factor must be positive, got {}".format(growth_factor))
+        if growth_every < 1:
+            raise ValueError("growth_every must be at least 1, got {}".format(growth_every))
+        if max_batch_size is not None and max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1, got {}".format(max_batch_size))
+        if learning_rate_scaling not in ("linear", "sqrt", "none"):
+            raise ValueError("unknown learning_rate_scaling: {}".format(learning_rate_scaling))
+        self._growth_factor = growth_factor
+        self._growth_every = growth_every
+        self._max_batch_size = max_batch_size
+        self._learning_rate_scaling = learning_rate_scaling
+
+    def batch_size(self, batch_size: int, epoch: int) -> int:
+        grown_batch_size = max(int(batch_size * self._growth_factor ** (epoch // self._growth_every)), 1)
+        return grown_batch_size if self._max_batch_size is None else min(grown_batch_size, self._max_batch_size)
+
+    def learning_rate_scale(self, batch_size: int, grown_batch_size: int) -> float:
+        if self._learning_rate_scaling == "linear":
+            return grown_batch_size / batch_size
+        if self._learning_rate_scaling == "sqrt":
+            return math.sqrt(grown_batch_size / batch_size)
+        return 1.0
@@ -7,6 +7,7 @@ from mlp.dataset import Dataset
 from mlp.generator import DataGenerator
 from mlp.model import Model
 from mlp.optimizer import SGD
+from mlp.scheduler import BatchSizeScheduler, CosinePolicy, LinearPolicy, Policy, StepPolicy, WarmupPolicy
 
 
 class Trainer:
@@ -40,6 +41,8 @@ class Trainer:
             start_learning_rate=self.args.start_learning_rate,
             end_learning_rate=self.args.end_learning_rate,
             momentum=self.args.momentum,
+            policy=self._get_policy(),
+            schedule_over_training=self.args.schedule_over_training,
         )
         Model(
             layer_sizes=self.args.layer_sizes,
@@ -49,6 +52,13 @@ class Trainer:
             min_delta=self.args.min_delta,
             display_freq=self.args.display_freq,
             verbose=self.args.verbose,
+            checkpoint_every=self.args.checkpoint_every,
+            batch_size_scheduler=BatchSizeScheduler(
+                growth_factor=self.args.batch_size_growth,
+                growth_every=self.args.batch_size_growth_every,
+                max_batch_size=self.args.max_batch_size,
+                learning_rate_scaling=self.args.learning_rate_scaling,
+            ),
         ).fit(
             train_dataset=train_dataset,
             test_dataset=test_dataset,
@@ -56,6 +66,14 @@ class Trainer:
             batch_size=self.args.batch_size,
         )
 
+    def _get_policy(self) -> Policy:
+        policy: Policy = LinearPolicy()
+        if self.args.learning_rate_policy == "cosine":
+            policy = CosinePolicy()
+        elif self.args.learning_rate_policy == "step":
+            policy = StepPolicy(drops=self.args.learning_rate_drops)
+        return WarmupPolicy(policy, warmup=self.args.warmup) if self.args.warmup != 0 else policy
+
     def _parse_arguments(self, *args: str) -> argparse.Namespace:
         parser = argparse.ArgumentParser(
             description="MLP LEARNING DEMO",
@@ -89,11 +107,50 @@ class Trainer:
             "-E", "--end-learning-rate", type=float, default=0.001, help="learning rate at the end of an epoch"
         )
         parser.add_argument("-M", "--momentum", type=float, default=0.8, help="momentum")
+        parser.add_argument(
+            "-P",
+            "--learning-rate-policy",
+            type=str,
+            choices=["linear", "cosine", "step"],
+            default="linear",
+            help="learning rate decay policy",
+        )
+        parser.add_argument(
+            "-T",
+            "--schedule-over-training",
+            action="store_true",
+            help="whether to apply learning rate policy over whole training instead of restarting it every epoch",
+        )
+        parser.add_argument(
+            "-D", "--learning-rate-drops", type=int, default=4, help="number of learning rate drops for step policy"
+        )
+        parser.add_argument(
+            "-W",
+            "--warmup",
+            type=float,
+            default=0.0,
+            help="fraction of an epoch (or of training with -T) spent warming up learning rate",
+        )
         parser.add_argument(
             "-l", "--loss-function", type=str, choices=["mse", "mae"], default="mae", help="loss function"
         )
         parser.add_argument("-e", "--epochs", type=int, default=20, help="number of training epochs")
         parser.add_argument("-b", "--batch-size", type=int, default=32, help="size of a training batch")
+        parser.add_argument(
+            "-g", "--batch-size-growth", type=float, default=1.0, help="factor by which batch size is multiplied"
+        )
+        parser.add_argument(
+            "-G", "--batch-size-growth-every", type=int, default=1, help="number of epochs between batch size growths"
+        )
+        parser.add_argument("-B", "--max-batch-size", type=int, default=None, help="maximal size of a training batch")
+        parser.add_argument(
+            "-s",
+            "--learning-rate-scaling",
+            type=str,
+            choices=["linear", "sqrt", "none"],
+            default="linear",
+            help="how learning rate is scaled with grown batch size",
+        )
         parser.add_argument("-p", "--patience", type=int, default=5, help="patience before early stopping")
         parser.add_argument("-m", "--min-delta", type=float, default=0.01, help="early stopping sensivity")
         parser.add_argument(
@@ -103,6 +160,13 @@ class Trainer:
             default=0.2,
             help="frequency of displaying training loss during an epoch",
         )
+        parser.add_argument(
+            "-c",
+            "--checkpoint-every",
+            type=int,
+            default=0,
+            help="number of layers recomputed together during backward pass (0 disables checkpointing)",
+        )
         parser.add_argument("-v", "--verbose", type=int, default=3, help="verbosity mode")
         parser.add_argument("-r", "--random-state", type=int, default=42, help="random state")
         return parser.parse_args(args or None)
@@ -120,12 +184,21 @@ class Trainer:
         self._display_parameter("start_learning_rate", model_parameters)
         self._display_parameter("end_learning_rate", model_parameters)
         self._display_parameter("momentum", model_parameters)
+        self._display_parameter("learning_rate_policy", model_parameters)
+        self._display_parameter("schedule_over_training", model_parameters)
+        self._display_parameter("learning_rate_drops", model_parameters)
+        self._display_parameter("warmup", model_parameters)
         self._display_parameter("loss_function", model_parameters)
         self._display_parameter("epochs", model_parameters)
         self._display_parameter("batch_size", model_parameters)
+        self._display_parameter("batch_size_growth", model_parameters)
+        self._display_parameter("batch_size_growth_every", model_parameters)
+        self._display_parameter("max_batch_size", model_parameters)
+        self._display_parameter("learning_rate_scaling", model_parameters)
         self._display_parameter("patience", model_parameters)
         self._display_parameter("min_delta", model_parameters)
         self._display_parameter("display_freq", model_parameters)
+        self._display_parameter("checkpoint_every", model_parameters)
         self._display_parameter("verbose", model_parameters)
         self._display_parameter("random_state", model_parameters)
         print()
@@ -1,5 +1,14 @@
 from test_mlp.test_engine import test_value_multiple_inputs, test_value_single_input
-from test_mlp.test_trainer import test_trainer
+from test_mlp.test_export import test_exporter
+from test_mlp.test_model import (
+    test_model_with_batch_size_larger_than_dataset,
+    test_model_with_batch_size_scheduler,
+    test_model_with_schedule_over_training,
+    test_model_without_epochs,
+)
+from test_mlp.test_nn import test_mlp_checkpointing
+from test_mlp.test_scheduler import test_batch_size_scheduler, test_policies, test_single_step_warmup
+from test_mlp.test_trainer import test_trainer, test_trainer_with_scheduler
 
 if __name__ == "__main__":
     print("Testing class Value with single input...")
@@ -8,6 +17,26 @@ if __name__ == "__main__":
     print("Testing class Value with multiple inputs...")
     test_value_multiple_inputs()
     print("...passed successfully!\n")
+    print("Testing class MLP with checkpointing...")
+    test_mlp_checkpointing()
+    print("...passed successfully!\n")
+    print("Testing class Exporter...")
+    test_exporter()
+    print("...passed successfully!\n")
+    print("Testing learning rate policies...")
+    test_policies()
+    test_single_step_warmup()
+    print("...passed successfully!\n")
+    print("Testing class BatchSizeScheduler...")
+    test_batch_size_scheduler()
+    print("...passed successfully!\n")
+    print("Testing class Model with BatchSizeScheduler...")
+    test_model_with_batch_size_scheduler()
+    test_model_with_schedule_over_training()
+    test_model_with_batch_size_larger_than_dataset()
+    test_model_without_epochs()
+    print("...passed successfully!\n")
     print("Testing class Trainer...")
     test_trainer()
+    test_trainer_with_scheduler()
     print("...passed successfully!")
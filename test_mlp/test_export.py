@@ -0,0 +1,44 @@
+import math
+import os
+import random
+import tempfile
+from typing import List, Union
+
+from mlp.engine import Value
+from mlp.evaluator import Evaluator
+from mlp.export import Exporter
+from mlp.nn import MLP
+
+
+def evaluate(mlp: MLP, x: List[float]) -> Union[float, List[float]]:
+    out = mlp(list(map(Value, x)))
+    return out.data if isinstance(out, Value) else [value.data for value in out]
+
+
+def test_exporter() -> None:
+    random.seed(0)
+    X = [[random.uniform(-5, 5) for _ in range(3)] for _ in range(8)]
+    for layer_sizes in ([4, 5, 1], [4, 2]):
+        mlp = MLP(3, layer_sizes)
+        y = [evaluate(mlp, x) for x in X]
+        for max_unrolled_parameters in (1000, 0):
+            exporter = Exporter(mlp, max_unrolled_parameters=max_unrolled_parameters)
+            predict = exporter.to_function()
+            assert [predict(*x) for x in X] == y
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "weights.json")
+            exporter.to_file(path)
+            evaluator = Evaluator.from_file(path)
+        assert evaluator(X) == y
+    try:
+        evaluator.predict_one(X[0][:2])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Evaluator accepted input of wrong size")
+    mlp = MLP(3, [4, 5, 1])
+    mlp.layers[-1].neurons[0].b.set_data(float("nan"))
+    mlp.layers[-1].neurons[0].w[0].set_data(float("inf"))
+    for max_unrolled_parameters in (1000, 0):
+        predict = Exporter(mlp, max_unrolled_parameters=max_unrolled_parameters).to_function()
+        assert all(math.isnan(predict(*x)) for x in X)
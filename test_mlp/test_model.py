@@ -0,0 +1,86 @@
+import random
+from typing import List, Optional, Tuple
+
+from mlp.dataset import Dataset
+from mlp.model import Model
+from mlp.optimizer import SGD
+from mlp.scheduler import BatchSizeScheduler
+
+
+class RecordingDataset(Dataset):
+    batch_sizes: List[int] = []
+
+    def iloc(self, start: int, end: int) -> Dataset:
+        RecordingDataset.batch_sizes.append(end - start)
+        return super().iloc(start, end)
+
+
+class RecordingSGD(SGD):
+    def __init__(
+        self, start_learning_rate: float, end_learning_rate: float, momentum: float, schedule_over_training: bool
+    ) -> None:
+        super().__init__(
+            start_learning_rate, end_learning_rate, momentum, schedule_over_training=schedule_over_training
+        )
+        self.learning_rates: List[float] = []
+
+    def update_parameters(self) -> None:
+        self.learning_rates.append(self._current_lr)
+        super().update_parameters()
+
+
+def fit(
+    batch_size_scheduler: BatchSizeScheduler, schedule_over_training: bool, epochs: int = 3, batch_size: int = 4
+) -> Tuple[List[int], List[float]]:
+    random.seed(0)
+    X = [[random.uniform(-1, 1) for _ in range(2)] for _ in range(16)]
+    y = [x1 + x2 for x1, x2 in X]
+    RecordingDataset.batch_sizes = []
+    optimizer = RecordingSGD(
+        start_learning_rate=0.01, end_learning_rate=0.001, momentum=0.8, schedule_over_training=schedule_over_training
+    )
+    Model(
+        layer_sizes=[3],
+        optimizer=optimizer,
+        loss="mse",
+        patience=10,
+        min_delta=0.0,
+        display_freq=0.5,
+        verbose=0,
+        batch_size_scheduler=batch_size_scheduler,
+    ).fit(RecordingDataset(X, y), Dataset(X, y), epochs=epochs, batch_size=batch_size)
+    return RecordingDataset.batch_sizes, optimizer.learning_rates
+
+
+def get_batch_size_scheduler(growth_factor: float = 2.0, max_batch_size: Optional[int] = 8) -> BatchSizeScheduler:
+    return BatchSizeScheduler(
+        growth_factor=growth_factor, growth_every=1, max_batch_size=max_batch_size, learning_rate_scaling="linear"
+    )
+
+
+def test_model_with_batch_size_scheduler() -> None:
+    batch_sizes, learning_rates = fit(get_batch_size_scheduler(), schedule_over_training=False)
+    assert batch_sizes == [4, 4, 4, 4, 8, 8, 8, 8]
+    expected = [0.01 - 0.009 * step / 4 for step in range(4)] + [2 * (0.01 - 0.009 * step / 2) for step in range(2)] * 2
+    assert all(abs(lr - expected_lr) < 1e-12 for lr, expected_lr in zip(learning_rates, expected))
+    assert len(learning_rates) == len(expected)
+
+
+def test_model_with_schedule_over_training() -> None:
+    batch_sizes, learning_rates = fit(get_batch_size_scheduler(), schedule_over_training=True)
+    assert batch_sizes == [4, 4, 4, 4, 8, 8, 8, 8]
+    scales = [1.0] * 4 + [2.0] * 4
+    expected = [scale * (0.01 - 0.009 * step / 8) for step, scale in enumerate(scales)]
+    assert all(abs(lr - expected_lr) < 1e-12 for lr, expected_lr in zip(learning_rates, expected))
+    assert len(learning_rates) == len(expected)
+
+
+def test_model_with_batch_size_larger_than_dataset() -> None:
+    batch_sizes, learning_rates = fit(get_batch_size_scheduler(1.0, None), schedule_over_training=False, batch_size=32)
+    assert batch_sizes == [16, 16, 16]
+    assert learning_rates == [0.01, 0.01, 0.01]
+
+
+def test_model_without_epochs() -> None:
+    for schedule_over_training in (False, True):
+        assert fit(get_batch_size_scheduler(), schedule_over_training=schedule_over_training, epochs=0) == ([], [])
@@ -0,0 +1,23 @@
+import random
+
+from mlp.engine import Value
+from mlp.nn import MLP
+
+
+def test_mlp_checkpointing() -> None:
+    for checkpoint_every in (2, 3):
+        random.seed(0)
+        X = [[random.uniform(-5, 5) for _ in range(3)] for _ in range(4)]
+        random.seed(0)
+        mlp = MLP(3, [4, 5, 3, 1])
+        random.seed(0)
+        checkpointed_mlp = MLP(3, [4, 5, 3, 1], checkpoint_every=checkpoint_every)
+        for x in X:
+            y = mlp(list(map(Value, x)))
+            checkpointed_y = checkpointed_mlp(list(map(Value, x)))
+            assert isinstance(y, Value) and isinstance(checkpointed_y, Value)
+            assert abs(y.data - checkpointed_y.data) < 1e-9
+            (y ** 2).backward()
+            (checkpointed_y ** 2).backward()
+        for parameter, checkpointed_parameter in zip(mlp.parameters, checkpointed_mlp.parameters):
+            assert abs(parameter.grad - checkpointed_parameter.grad) < 1e-6
@@ -0,0 +1,53 @@
+from mlp.scheduler import BatchSizeScheduler, CosinePolicy, LinearPolicy, StepPolicy, WarmupPolicy
+
+
+def test_policies() -> None:
+    assert abs(LinearPolicy()(0.01, 0.001, 5, 10) - 0.0055) < 1e-12
+    assert abs(CosinePolicy()(0.01, 0.001, 0, 10) - 0.01) < 1e-12
+    assert abs(CosinePolicy()(0.01, 0.001, 5, 10) - 0.0055) < 1e-12
+    assert abs(StepPolicy(drops=2)(0.01, 0.001, 4, 10) - 0.01) < 1e-12
+    assert abs(StepPolicy(drops=2)(0.01, 0.001, 5, 10) - 0.01 * 0.1 ** 0.5) < 1e-12
+    warmup_policy = WarmupPolicy(LinearPolicy(), warmup=0.4)
+    assert abs(warmup_policy(0.01, 0.001, 0, 10) - 0.01 / 5) < 1e-12
+    assert abs(warmup_policy(0.01, 0.001, 1, 10) - 0.0091 * 2 / 5) < 1e-12
+    assert abs(warmup_policy(0.01, 0.001, 4, 10) - 0.0064) < 1e-12
+    for create_policy in (
+        lambda: StepPolicy(drops=0),
+        lambda: WarmupPolicy(LinearPolicy(), warmup=-0.1),
+        lambda: WarmupPolicy(LinearPolicy(), warmup=2.0),
+    ):
+        try:
+            create_policy()
+        except ValueError:
+            continue
+        raise AssertionError("Policy accepted invalid arguments")
+
+
+def test_single_step_warmup() -> None:
+    policy = WarmupPolicy(CosinePolicy(), warmup=0.25)
+    learning_rates = [policy(0.01, 0.001, step, 4) for step in range(4)]
+    assert abs(learning_rates[0] - 0.005) < 1e-12
+    assert learning_rates[1:] == [CosinePolicy()(0.01, 0.001, step, 4) for step in range(1, 4)]
+
+
+def test_batch_size_scheduler() -> None:
+    scheduler = BatchSizeScheduler(growth_factor=2.0, growth_every=2, max_batch_size=64, learning_rate_scaling="linear")
+    assert [scheduler.batch_size(16, epoch) for epoch in range(6)] == [16, 16, 32, 32, 64, 64]
+    assert scheduler.learning_rate_scale(16, 64) == 4.0
+    scheduler = BatchSizeScheduler(growth_factor=2.0, growth_every=1, max_batch_size=None, learning_rate_scaling="sqrt")
+    assert scheduler.learning_rate_scale(16, 64) == 2.0
+    scheduler = BatchSizeScheduler(growth_factor=0.5, growth_every=1, max_batch_size=None, learning_rate_scaling="none")
+    assert scheduler.batch_size(4, 5) == 1
+    for kwargs in (
+        {"growth_factor": 0.0},
+        {"growth_every": 0},
+        {"max_batch_size": 0},
+        {"learning_rate_scaling": "cubic"},
+    ):
+        arguments = {"growth_factor": 2.0, "growth_every": 1, "max_batch_size": None, "learning_rate_scaling": "linear"}
+        arguments.update(kwargs)
+        try:
+            BatchSizeScheduler(**arguments)  # type: ignore
+        except ValueError:
+            continue
+        raise AssertionError("BatchSizeScheduler accepted {}".format(kwargs))
@@ -21,3 +21,11 @@ def get_kwargs() -> Dict[str, Any]:
 
 def test_trainer() -> None:
     Trainer("").run(**get_kwargs())
+
+
+def test_trainer_with_scheduler() -> None:
+    kwargs = get_kwargs()
+    kwargs["model_parameters"].update(
+        {"batch_size_growth": 2.0, "max_batch_size": 16, "learning_rate_policy": "cosine", "warmup": 0.25}
+    )
+    Trainer("").run(**kwargs)